@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as UserAdmin_
 from django.contrib.auth.models import Group, User
+from django.db.models import Count
 
 from users.models import ObjectPermission, Token
 from . import filters, forms, inlines
@@ -23,9 +24,12 @@ class GroupAdmin(admin.ModelAdmin):
     search_fields = ('name',)
     inlines = [inlines.GroupObjectPermissionInline]
 
-    @staticmethod
-    def user_count(obj):
-        return obj.user_set.count()
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(user_count=Count('user'))
+
+    def user_count(self, obj):
+        return obj.user_count
+    user_count.admin_order_field = 'user_count'
 
 
 @admin.register(User)
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib import messages
@@ -6,11 +7,13 @@ from django.contrib.auth import login as auth_login, logout as auth_logout, upda
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import update_last_login
 from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
 from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect, render, resolve_url
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.http import url_has_allowed_host_and_scheme, urlencode
+from django.views.decorators.cache import cache_control
 from django.views.decorators.debug import sensitive_post_parameters
 from django.views.generic import View
 from social_core.backends.utils import load_backends
@@ -30,6 +33,27 @@ from .tables import TokenTable
 # Login/logout
 #
 
+@lru_cache(maxsize=None)
+def get_static_auth_backends():
+    """
+    Return a (display_name, icon_name, url, idp) tuple for each enabled authentication backend (and for each SAML
+    IdP, if any). These depend only on settings and the URL configuration, so they are resolved once per process.
+    """
+    auth_backends = []
+    saml_idps = get_saml_idps()
+
+    for name in load_backends(settings.AUTHENTICATION_BACKENDS).keys():
+        display_name, icon_name = get_auth_backend_display(name)
+        url = reverse('social:begin', args=[name])
+        if name.lower() == 'saml' and saml_idps:
+            for idp in saml_idps:
+                auth_backends.append((f'{display_name} ({idp})', icon_name, url, idp))
+        else:
+            auth_backends.append((display_name, icon_name, url, None))
+
+    return tuple(auth_backends)
+
+
 class LoginView(View):
     """
     Perform user authentication via the web UI.
@@ -40,41 +64,31 @@ class LoginView(View):
     def dispatch(self, *args, **kwargs):
         return super().dispatch(*args, **kwargs)
 
-    def gen_auth_data(self, name, url, params):
-        display_name, icon_name = get_auth_backend_display(name)
-        return {
-            'display_name': display_name,
-            'icon_name': icon_name,
-            'url': f'{url}?{urlencode(params)}',
-        }
-
     def get_auth_backends(self, request):
         auth_backends = []
-        saml_idps = get_saml_idps()
+        next = request.GET.get('next')
 
-        for name in load_backends(settings.AUTHENTICATION_BACKENDS).keys():
-            url = reverse('social:begin', args=[name])
+        for display_name, icon_name, url, idp in get_static_auth_backends():
             params = {}
-            if next := request.GET.get('next'):
+            if next:
                 params['next'] = next
-            if name.lower() == 'saml' and saml_idps:
-                for idp in saml_idps:
-                    params['idp'] = idp
-                    data = self.gen_auth_data(name, url, params)
-                    data['display_name'] = f'{data["display_name"]} ({idp})'
-                    auth_backends.append(data)
-            else:
-                auth_backends.append(self.gen_auth_data(name, url, params))
+            if idp is not None:
+                params['idp'] = idp
+            auth_backends.append({
+                'display_name': display_name,
+                'icon_name': icon_name,
+                'url': f'{url}?{urlencode(params)}',
+            })
 
         return auth_backends
 
     def get(self, request):
-        form = LoginForm(request)
-
         if request.user.is_authenticated:
             logger = logging.getLogger('netbox.auth.login')
             return self.redirect_to_next(request, logger)
 
+        form = LoginForm(request)
+
         return render(request, self.template_name, {
             'form': form,
             'auth_backends': self.get_auth_backends(request),
@@ -89,7 +103,8 @@ class LoginView(View):
 
             # If maintenance mode is enabled, assume the database is read-only, and disable updating the user's
             # last_login time upon authentication.
-            if get_config().MAINTENANCE_MODE:
+            config = get_config()
+            if config.MAINTENANCE_MODE:
                 logger.warning("Maintenance mode enabled: disabling update of most recent login time")
                 user_logged_in.disconnect(update_last_login, dispatch_uid='update_last_login')
 
@@ -100,9 +115,10 @@ class LoginView(View):
 
             # Ensure the user has a UserConfig defined. (This should normally be handled by
             # create_userconfig() on user creation.)
-            if not hasattr(request.user, 'config'):
-                config = get_config()
-                UserConfig(user=request.user, data=config.DEFAULT_USER_PREFERENCES).save()
+            UserConfig.objects.get_or_create(
+                user=request.user,
+                defaults={'data': config.DEFAULT_USER_PREFERENCES}
+            )
 
             return self.redirect_to_next(request, logger)
 
@@ -156,12 +172,13 @@ class LogoutView(View):
 class ProfileView(LoginRequiredMixin, View):
     template_name = 'users/profile.html'
 
+    @method_decorator(cache_control(private=True, max_age=0, must_revalidate=True))
     def get(self, request):
 
-        # Compile changelog table
+        # Compile changelog table (omitting the pre- & post-change data, which is not displayed)
         changelog = ObjectChange.objects.restrict(request.user, 'view').filter(user=request.user).prefetch_related(
             'changed_object_type'
-        )[:20]
+        ).defer('prechange_data', 'postchange_data')[:20]
         changelog_table = ObjectChangeTable(changelog)
 
         return render(request, self.template_name, {
@@ -173,6 +190,7 @@ class ProfileView(LoginRequiredMixin, View):
 class UserConfigView(LoginRequiredMixin, View):
     template_name = 'users/preferences.html'
 
+    @method_decorator(cache_control(private=True, max_age=0, must_revalidate=True))
     def get(self, request):
         userconfig = request.user.config
         form = UserConfigForm(instance=userconfig)
@@ -201,6 +219,7 @@ class UserConfigView(LoginRequiredMixin, View):
 class ChangePasswordView(LoginRequiredMixin, View):
     template_name = 'users/password.html'
 
+    @method_decorator(cache_control(private=True, max_age=0, must_revalidate=True))
     def get(self, request):
         # LDAP users cannot change their password here
         if getattr(request.user, 'ldap_username', None):
@@ -241,7 +260,6 @@ class TokenListView(LoginRequiredMixin, View):
         table.configure(request)
 
         return render(request, 'users/api_tokens.html', {
-            'tokens': tokens,
             'active_tab': 'api-tokens',
             'table': table,
         })
@@ -267,32 +285,35 @@ class TokenEditView(LoginRequiredMixin, View):
 
     def post(self, request, pk=None):
 
-        if pk:
-            token = get_object_or_404(Token.objects.filter(user=request.user), pk=pk)
-            form = TokenForm(request.POST, instance=token)
-        else:
-            token = Token(user=request.user)
-            form = TokenForm(request.POST)
-
-        if form.is_valid():
+        with transaction.atomic():
 
-            token = form.save(commit=False)
-            token.user = request.user
-            token.save()
-
-            msg = f"Modified token {token}" if pk else f"Created token {token}"
-            messages.success(request, msg)
-
-            if not pk and not settings.ALLOW_TOKEN_RETRIEVAL:
-                return render(request, 'users/api_token.html', {
-                    'object': token,
-                    'key': token.key,
-                    'return_url': reverse('users:token_list'),
-                })
-            elif '_addanother' in request.POST:
-                return redirect(request.path)
+            # Lock an existing token for the duration of the edit to avoid concurrent modification
+            if pk:
+                token = get_object_or_404(Token.objects.select_for_update().filter(user=request.user), pk=pk)
+                form = TokenForm(request.POST, instance=token)
             else:
-                return redirect('users:token_list')
+                token = Token(user=request.user)
+                form = TokenForm(request.POST)
+
+            if form.is_valid():
+
+                token = form.save(commit=False)
+                token.user = request.user
+                token.save()
+
+                msg = f"Modified token {token}" if pk else f"Created token {token}"
+                messages.success(request, msg)
+
+                if not pk and not settings.ALLOW_TOKEN_RETRIEVAL:
+                    return render(request, 'users/api_token.html', {
+                        'object': token,
+                        'key': token.key,
+                        'return_url': reverse('users:token_list'),
+                    })
+                elif '_addanother' in request.POST:
+                    return redirect(request.path)
+                else:
+                    return redirect('users:token_list')
 
         return render(request, 'generic/object_edit.html', {
             'object': token,
@@ -321,12 +342,13 @@ class TokenDeleteView(LoginRequiredMixin, View):
 
     def post(self, request, pk):
 
-        token = get_object_or_404(Token.objects.filter(user=request.user), pk=pk)
-        form = ConfirmationForm(request.POST)
-        if form.is_valid():
-            token.delete()
-            messages.success(request, "Token deleted")
-            return redirect('users:token_list')
+        with transaction.atomic():
+            token = get_object_or_404(Token.objects.select_for_update().filter(user=request.user), pk=pk)
+            form = ConfirmationForm(request.POST)
+            if form.is_valid():
+                token.delete()
+                messages.success(request, "Token deleted")
+                return redirect('users:token_list')
 
         return render(request, 'generic/object_delete.html', {
             'object': token,